@@ -1,5 +1,35 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Union
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # Numba is optional; the NumPy path is used without it
+    njit = None
+
+# Rows processed per block when scores are streamed instead of materialized
+_CHUNK_SIZE = 65536
+
+# Scores are rounded to this many decimals before identification, so that summing
+# fractional weights in a different order cannot move anyone across the cutoff
+_SCORE_DECIMALS = 9
+
+
+def _deprivation(dims: np.ndarray, cutoffs: np.ndarray) -> np.ndarray:
+    """
+    Calculate the deprivation matrix (g0) on raw arrays.
+
+    Args:
+        dims (np.ndarray): (N, K) dimensions matrix.
+        cutoffs (np.ndarray): (K,) cutoff value of each dimension.
+
+    Returns:
+        np.ndarray: (N, K) uint8 deprivation matrix.
+    """
+    # Compare every cell against its column's cutoff in a single vectorized pass,
+    # reinterpreting the boolean result as one-byte 0/1 values without a copy
+    return (dims == cutoffs[None, :]).view(np.uint8)
 
 
 def get_deprivation_matrix(
@@ -15,22 +45,35 @@ def get_deprivation_matrix(
     Returns:
         pd.DataFrame: Deprivation matrix (g0).
     """
-    # Get column names for the dataframes
-    dimensions_column_names: List[str] = dimensions_matrix.columns
+    # Line the cutoff values up positionally with the dimension columns
+    cutoffs = cutoff_matrix["Cutoff"].to_numpy()
+    g0 = _deprivation(dimensions_matrix.to_numpy(), cutoffs)
 
-    # Create a copy of the dimensions matrix as the deprivation matrix
-    deprivation_matrix: pd.DataFrame = dimensions_matrix.copy()
-
-    # Generate values for the deprivation matrix based on dimensions and cutoff values
-    for index, col_name in enumerate(dimensions_column_names):
-        cutoff_value = cutoff_matrix.at[index, "Cutoff"]
-        deprivation_matrix[col_name] = deprivation_matrix[col_name].apply(
-            lambda value: 1 if value == cutoff_value else 0
-        )
+    deprivation_matrix = pd.DataFrame(
+        g0, columns=dimensions_matrix.columns, index=dimensions_matrix.index
+    )
 
     return deprivation_matrix
 
 
+def _weighted(g0: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Calculate the weighted deprivation matrix on raw arrays.
+
+    Args:
+        g0 (np.ndarray): (N, K) deprivation matrix.
+        weights (np.ndarray): (K,) vector of dimension weights.
+
+    Returns:
+        np.ndarray: (N, K) weighted deprivation matrix.
+    """
+    # Promote g0 to float once, then scale every column in place with one broadcast
+    weighted = np.array(g0, dtype=np.float64)
+    weighted *= weights[None, :]
+
+    return weighted
+
+
 def calculate_weighted_deprivation_matrix(
     deprivation_matrix: pd.DataFrame, weights_matrix: pd.DataFrame
 ) -> pd.DataFrame:
@@ -44,20 +87,57 @@ def calculate_weighted_deprivation_matrix(
     Returns:
         pd.DataFrame: Weighted deprivation matrix.
     """
-    # Iterate through columns of the deprivation matrix
-    for index, col_name in enumerate(deprivation_matrix.columns):
-        # Get the weight corresponding to the column
-        weight = weights_matrix.at[index, "Weight"]
+    # Line the weights up positionally with the deprivation matrix columns
+    weights = weights_matrix["Weight"].to_numpy(dtype=np.float64)
 
-        # Multiply the values in the column by the weight
-        deprivation_matrix[col_name] = deprivation_matrix[col_name] * weight
+    weighted = _weighted(deprivation_matrix.to_numpy(), weights)
+
+    weighted_deprivation_matrix = pd.DataFrame(
+        weighted, columns=deprivation_matrix.columns, index=deprivation_matrix.index
+    )
+
+    return weighted_deprivation_matrix
+
+
+def _scores(g0: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Calculate deprivation scores straight from the deprivation matrix and weights.
+
+    Args:
+        g0 (np.ndarray): (N, K) deprivation matrix.
+        weights (np.ndarray): (K,) vector of dimension weights.
+
+    Returns:
+        np.ndarray: (N,) deprivation scores.
+    """
+    # Give the matrix and the vector the same contiguous float dtype so the product
+    # runs as a single BLAS GEMV that weights the deprivations and sums each row
+    dtype = np.result_type(weights.dtype, np.float32)
+    g0 = np.ascontiguousarray(g0, dtype=dtype)
+    weights = np.ascontiguousarray(weights, dtype=dtype)
+
+    return g0 @ weights
 
-    return deprivation_matrix
+
+def _scores_to_numpy(scores_vector: Union[pd.DataFrame, pd.Series]) -> np.ndarray:
+    """
+    Get the raw scores array from a "Scores" Series or a one-column "Scores" DataFrame.
+
+    Args:
+        scores_vector (Union[pd.DataFrame, pd.Series]): Deprivation scores.
+
+    Returns:
+        np.ndarray: (N,) deprivation scores.
+    """
+    if isinstance(scores_vector, pd.DataFrame):
+        scores_vector = scores_vector["Scores"]
+
+    return scores_vector.to_numpy()
 
 
 def calculate_deprevation_scores(
     weighted_deprivation_matrix: pd.DataFrame,
-) -> pd.DataFrame:
+) -> pd.Series:
     """
     Calculate deprivation scores based on the weighted deprivation matrix.
 
@@ -65,79 +145,90 @@ def calculate_deprevation_scores(
         weighted_deprivation_matrix (pd.DataFrame): DataFrame containing weighted deprivation values.
 
     Returns:
-        pd.DataFrame: DataFrame containing deprivation scores.
+        pd.Series: Series named "Scores" containing deprivation scores.
     """
-    # Determine the number of rows in the weighted deprivation matrix
-    number_of_rows = len(weighted_deprivation_matrix)
+    # Sum each row of the raw array in one reduction, skipping pandas' row alignment.
+    # Summation order may differ from the GEMV in _scores; _censor rounds that away
+    scores = weighted_deprivation_matrix.to_numpy().sum(axis=1)
 
-    # Initialize a DataFrame to store the deprivation scores
-    data = {"Scores": [0] * number_of_rows}
-    deprevation_scores = pd.DataFrame(data)
+    deprevation_scores = pd.Series(scores, name="Scores")
 
-    # Calculate the deprivation score for each row in the weighted deprivation matrix
-    for index in range(number_of_rows):
-        deprevation_score = weighted_deprivation_matrix.iloc[index].sum()
+    return deprevation_scores
 
-        # Update the 'Scores' column in the deprivation scores DataFrame
-        deprevation_scores.at[index, "Scores"] = deprevation_score
 
-    return deprevation_scores
+def _censor(scores: np.ndarray, cutoff_score: float) -> np.ndarray:
+    """
+    Censor deprivation scores on raw arrays.
+
+    Args:
+        scores (np.ndarray): (N,) deprivation scores.
+        cutoff_score (float): Cutoff score used to censor deprivation scores.
+
+    Returns:
+        np.ndarray: (N,) censored deprivation scores.
+    """
+    # Round away summation-order noise in the comparison only, so identification is
+    # stable at the cutoff while the scores themselves are returned unchanged
+    identified = np.round(scores.astype(np.float64), _SCORE_DECIMALS) >= cutoff_score
+
+    # Apply censoring: If the deprivation score is below the cutoff, set it to 0
+    return np.where(identified, scores, 0)
 
 
 def get_censored_vector(
-    deprevation_scores_vector: pd.DataFrame, cutoff_score: int
-) -> pd.DataFrame:
+    deprevation_scores_vector: Union[pd.DataFrame, pd.Series], cutoff_score: int
+) -> pd.Series:
     """
     Generate a censored vector based on deprivation scores and a cutoff score.
 
     Args:
-        deprevation_scores_vector (pd.DataFrame): DataFrame containing deprivation scores.
+        deprevation_scores_vector (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing deprivation scores.
         cutoff_score (int): Cutoff score used to censor deprivation scores.
 
     Returns:
-        pd.DataFrame: Censored vector of deprivation scores.
+        pd.Series: Series named "Scores" containing the censored deprivation scores.
     """
-    # Create a copy of the deprivation scores vector
-    censored_vector = deprevation_scores_vector.copy()
-
-    # Iterate through the rows of the vector and apply censoring
-    for index in range(len(censored_vector)):
-        deprivation_score = censored_vector.at[index, "Scores"]
-
-        # Apply censoring: If the deprivation score is below the cutoff, set it to 0
-        censored_vector.at[index, "Scores"] = (
-            deprivation_score if deprivation_score >= cutoff_score else 0
-        )
+    censored_vector = pd.Series(
+        _censor(_scores_to_numpy(deprevation_scores_vector), cutoff_score),
+        index=deprevation_scores_vector.index,
+        name="Scores",
+    )
 
     return censored_vector
 
 
-def get_head_count_ratio(censored_vector: pd.DataFrame) -> float:
+def get_head_count_ratio(
+    censored_vector: Union[pd.DataFrame, pd.Series], number_of_poor: Optional[int] = None
+) -> float:
     """
     Calculate the headcount ratio (H) based on a censored vector.
 
     The headcount ratio (H) represents the percentage of the population with a positive score in the censored vector.
 
     Args:
-        censored_vector (pd.DataFrame): DataFrame containing censored deprivation scores.
+        censored_vector (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing censored deprivation scores.
+        number_of_poor (Optional[int]): Precomputed count of positive scores. Counted from the vector when omitted.
 
     Returns:
         float: The headcount ratio as a percentage.
     """
     # Calculate the count of individuals with a positive score
-    positive_count = len(censored_vector.loc[censored_vector["Scores"] > 0])
+    if number_of_poor is None:
+        number_of_poor = int((_scores_to_numpy(censored_vector) > 0).sum())
 
     # Calculate the total count of individuals in the censored vector
     total_count = len(censored_vector)
 
     # Calculate the headcount ratio as a percentage
-    headcount_ratio = 100 * (positive_count / total_count)
+    headcount_ratio = 100 * (number_of_poor / total_count) if total_count != 0 else 0.0
 
     return headcount_ratio
 
 
 def get_average_deprivation_score(
-    censored_vector: pd.DataFrame, number_of_dimensions: int
+    censored_vector: Union[pd.DataFrame, pd.Series],
+    number_of_dimensions: int,
+    number_of_poor: Optional[int] = None,
 ) -> float:
     """
     Calculate the average deprivation score for the Alkire-Foster method.
@@ -145,20 +236,28 @@ def get_average_deprivation_score(
     The average deprivation score is the weighted average of deprivation scores for individuals classified as poor.
 
     Args:
-        censored_vector (pd.DataFrame): DataFrame containing censored deprivation scores.
+        censored_vector (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing censored deprivation scores.
         number_of_dimensions (int): Total number of dimensions or indicators.
+        number_of_poor (Optional[int]): Precomputed count of positive scores. Counted from the vector when omitted.
 
     Returns:
         float: The average deprivation score as a percentage.
     """
+    scores = _scores_to_numpy(censored_vector)
+
     # Calculate the sum of deprivation scores for individuals classified as poor
-    scores_sum = censored_vector["Scores"].sum()
+    scores_sum = scores.sum()
 
     # Calculate the total count of poor individuals
-    total_poor_people = len(censored_vector.loc[censored_vector["Scores"] > 0])
+    if number_of_poor is None:
+        number_of_poor = int((scores > 0).sum())
 
     # Calculate the average deprivation score
-    average_deprivation_score = (scores_sum / number_of_dimensions) / total_poor_people
+    average_deprivation_score = (
+        0.0
+        if number_of_poor == 0
+        else (scores_sum / number_of_dimensions) / number_of_poor
+    )
 
     # Convert the average deprivation score to a percentage
     average_deprivation_score_percentage = 100 * average_deprivation_score
@@ -191,34 +290,208 @@ def get_adjusted_head_count_ratio(
     return adjusted_headcount_ratio
 
 
+def _chunked_scores(
+    dimensions_matrix: pd.DataFrame, cutoffs: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate deprivation scores from the dimensions matrix one block of rows at a time.
+
+    Only a (_CHUNK_SIZE, K) slice of the dimensions and deprivation matrices exists at any moment.
+
+    Args:
+        dimensions_matrix (pd.DataFrame): DataFrame containing dimensions data.
+        cutoffs (np.ndarray): (K,) cutoff value of each dimension.
+        weights (np.ndarray): (K,) vector of dimension weights.
+
+    Returns:
+        np.ndarray: (N,) deprivation scores.
+    """
+    number_of_people = len(dimensions_matrix)
+    scores = np.empty(number_of_people, dtype=np.result_type(weights.dtype, np.float32))
+
+    for start in range(0, number_of_people, _CHUNK_SIZE):
+        stop = start + _CHUNK_SIZE
+
+        # Slice the frame before converting so mixed-type columns never become one N x K object array
+        dims = dimensions_matrix.iloc[start:stop].to_numpy()
+        scores[start:stop] = _scores(_deprivation(dims, cutoffs), weights)
+
+    return scores
+
+
+def _chunked_totals(
+    dimensions_matrix: pd.DataFrame,
+    cutoffs: np.ndarray,
+    weights: np.ndarray,
+    cutoff_score: float,
+) -> Tuple[int, float]:
+    """
+    Count the poor and sum their scores one block of rows at a time, keeping only the totals.
+
+    Args:
+        dimensions_matrix (pd.DataFrame): DataFrame containing dimensions data.
+        cutoffs (np.ndarray): (K,) cutoff value of each dimension.
+        weights (np.ndarray): (K,) vector of dimension weights.
+        cutoff_score (float): Cutoff score used to identify the poor.
+
+    Returns:
+        Tuple[int, float]: The number of poor people and the sum of their scores.
+    """
+    number_of_poor = 0
+    scores_sum = 0.0
+
+    for start in range(0, len(dimensions_matrix), _CHUNK_SIZE):
+        stop = start + _CHUNK_SIZE
+        g0 = _deprivation(dimensions_matrix.iloc[start:stop].to_numpy(), cutoffs)
+        censored = _censor(_scores(g0, weights), cutoff_score)
+
+        # The poor are those with a positive score that survives censoring
+        number_of_poor += int((censored > 0).sum())
+        scores_sum += float(censored.sum())
+
+    return number_of_poor, scores_sum
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _af_kernel(dims, cutoffs, weights, cutoff_score):
+        """
+        Count the poor and sum their scores in one fused pass over the rows.
+
+        Args:
+            dims (np.ndarray): (N, K) numeric or boolean dimensions matrix.
+            cutoffs (np.ndarray): (K,) cutoff value of each dimension.
+            weights (np.ndarray): (K,) vector of dimension weights.
+            cutoff_score (float): Cutoff score used to identify the poor.
+
+        Returns:
+            Tuple[int, float]: The number of poor people and the sum of their scores.
+        """
+        n, k = dims.shape
+        number_of_poor = 0
+        scores_sum = 0.0
+        for i in prange(n):
+            score = 0.0
+            for j in range(k):
+                if dims[i, j] == cutoffs[j]:
+                    score += weights[j]
+            # Round for the comparison exactly as np.round does in _censor
+            rounded = np.rint(score * 10.0**_SCORE_DECIMALS) / 10.0**_SCORE_DECIMALS
+            if rounded >= cutoff_score and score > 0:
+                number_of_poor += 1
+                scores_sum += score
+        return number_of_poor, scores_sum
+
+else:
+    _af_kernel = None
+
+# Dtypes Numba can compile _af_kernel for; anything else (float16, object,
+# pandas extension types) is streamed through NumPy instead
+_KERNEL_DTYPES = frozenset(
+    np.dtype(dtype)
+    for dtype in (
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+    )
+)
+
+
+def calculate_poverty_measures(
+    dimensions_matrix: pd.DataFrame,
+    cutoff_matrix: pd.DataFrame,
+    weights_matrix: pd.DataFrame,
+    cutoff_score: float,
+) -> Dict[str, float]:
+    """
+    Calculate H, A and Mo for a single cutoff score straight from the input matrices.
+
+    Args:
+        dimensions_matrix (pd.DataFrame): DataFrame containing dimensions data.
+        cutoff_matrix (pd.DataFrame): DataFrame containing cutoff values.
+        weights_matrix (pd.DataFrame): DataFrame containing weights.
+        cutoff_score (float): Cutoff score used to identify the poor.
+
+    Returns:
+        Dict[str, float]: The headcount ratio, average deprivation score and adjusted headcount ratio as percentages.
+    """
+    weights = weights_matrix["Weight"].to_numpy(dtype=np.float64)
+    cutoffs = cutoff_matrix["Cutoff"].to_numpy()
+
+    # Neither path builds an (N, K) copy of the input or of the deprivation matrix.
+    # The compiled kernel reads a single numeric NumPy block as a view; text, mixed
+    # or extension-typed columns are streamed through NumPy one block at a time.
+    # On a single thread the streamed GEMV runs about twice as fast as the kernel's
+    # strided row loop (2M x 9 booleans), so the kernel is only picked when Numba
+    # can spread the rows over several threads
+    dtypes = set(dimensions_matrix.dtypes)
+    numeric_block = (
+        len(dtypes) == 1
+        and dtypes <= _KERNEL_DTYPES
+        and cutoffs.dtype in _KERNEL_DTYPES
+    )
+    if _af_kernel is not None and numeric_block and get_num_threads() > 1:
+        number_of_poor, scores_sum = _af_kernel(
+            dimensions_matrix.to_numpy(), cutoffs, weights, float(cutoff_score)
+        )
+    else:
+        number_of_poor, scores_sum = _chunked_totals(
+            dimensions_matrix, cutoffs, weights, cutoff_score
+        )
+
+    number_of_people, number_of_dimensions = dimensions_matrix.shape
+    H = number_of_poor / number_of_people if number_of_people else 0.0
+    A = scores_sum / (number_of_dimensions * number_of_poor) if number_of_poor else 0.0
+
+    return {"H": 100 * H, "A": 100 * A, "Mo": 100 * H * A}
+
+
 def calculate_subgroup_data(
-    demographics_matrix: pd.DataFrame, censored: pd.DataFrame
+    demographics_matrix: pd.DataFrame,
+    censored: Union[pd.DataFrame, pd.Series],
+    poor_mask: Optional[np.ndarray] = None,
 ) -> list:
     """
     Calculate subgroup data based on the demographics matrix and censored data.
 
     Args:
         demographics_matrix (pd.DataFrame): DataFrame containing demographic information.
-        censored (pd.DataFrame): DataFrame containing censored data.
+        censored (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing censored scores.
+        poor_mask (Optional[np.ndarray]): Precomputed boolean mask of positive censored scores. Built from censored when omitted.
 
     Returns:
         list: List of subgroups along with their corresponding data.
     """
     sub_groups_data = []
 
+    # The poverty mask and total do not depend on the demographic column
+    if poor_mask is None:
+        poor_mask = _scores_to_numpy(censored) > 0
+    total_censored = int(poor_mask.sum())
+
     for col in demographics_matrix.columns:
         sub_group_name = col
-        sub_group_data = {}
-        total_censored = len(censored[censored["Scores"] > 0])
-
-        for value in demographics_matrix[col].unique():
-            subgroup_censored_count = len(
-                demographics_matrix[
-                    (demographics_matrix[col] == value) & (censored["Scores"] > 0)
-                ]
-            )
-            percentage = subgroup_censored_count / total_censored
-            sub_group_data[value] = percentage
+
+        # Encode the categories in order of appearance and count the poor per code in one pass
+        codes, categories = pd.factorize(demographics_matrix[col], use_na_sentinel=False)
+        subgroup_censored_counts = np.bincount(
+            codes[poor_mask], minlength=len(categories)
+        )
+
+        if total_censored == 0:
+            percentages = np.zeros(len(categories))
+        else:
+            percentages = subgroup_censored_counts / total_censored
+        sub_group_data = dict(zip(categories, percentages.tolist()))
 
         sub_groups_data.append([sub_group_name, sub_group_data])
 
@@ -232,35 +505,38 @@ def calculate_products(subgroup_data):
         subgroup_data (list): List of pre-calculated subgroup data.
 
     Returns:
-        dict: A dictionary containing the calculated products for different subgroups.
+        dict: A dictionary keyed by (subgroupA, subgroupB) tuples whose values hold parallel
+        "labels" ("labelA-labelB") and "values" arrays.
     """
-    # Prepare data for product calculation
+    # Prepare per-subgroup label and percentage arrays for product calculation
     demographics = []
-    for result in subgroup_data:
-        name = result[0]
-        percentages = result[1]
-        for key, value in percentages.items():
-            demographics.append([name, key, value])
+    for name, percentages in subgroup_data:
+        labels = np.array(list(percentages.keys()), dtype=str)
+        values = np.fromiter(percentages.values(), dtype=np.float64, count=len(percentages))
+        demographics.append((name, labels, values))
 
-    # Calculate products for different subgroups
+    # Calculate products for every pair of different subgroups as one outer product
     products = {}
-    for i in range(len(demographics)):
-        for j in range(i + 1, len(demographics)):
-            if demographics[i][0] != demographics[j][0]:
-                demograph = demographics[i][0] + "-" + demographics[j][0]
-                names = demographics[i][1] + "-" + demographics[j][1]
-                product = demographics[i][2] * demographics[j][2]
-                products.setdefault(demograph, []).append([names, product])
+    for i, (name_a, labels_a, values_a) in enumerate(demographics):
+        for name_b, labels_b, values_b in demographics[i + 1 :]:
+            if name_a == name_b or labels_a.size == 0 or labels_b.size == 0:
+                continue
+
+            labels = np.char.add(np.char.add(labels_a[:, None], "-"), labels_b[None, :])
+            products[(name_a, name_b)] = {
+                "labels": labels.ravel(),
+                "values": (values_a[:, None] * values_b[None, :]).ravel(),
+            }
 
     return products
 
 
-def calculate_values(scores: pd.DataFrame, number_of_dimensions: int) -> List[Dict[str, float]]:
+def calculate_values(scores: Union[pd.DataFrame, pd.Series], number_of_dimensions: int) -> List[Dict[str, float]]:
     """
     Calculate multidimensional poverty values based on the Alkire-Foster method.
 
     Parameters:
-    - scores (pd.DataFrame): DataFrame containing the scores for each individual across multiple dimensions.
+    - scores (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing the scores for each individual across multiple dimensions.
     - number_of_dimensions (int): The number of dimensions for which the poverty values are calculated.
 
     Returns:
@@ -270,15 +546,19 @@ def calculate_values(scores: pd.DataFrame, number_of_dimensions: int) -> List[Di
     # Empty list to store values
     values = []
 
+    # Censoring never changes the population size, so count it once
+    p = len(scores)
+
     for k in range(1, number_of_dimensions):
         # Get censored vector for the current dimension
         censored = get_censored_vector(scores, k)
 
+        # Count the poor once and share it between H and A
+        q = int((censored.to_numpy() > 0).sum())
+
         # Calculate values based on Alkire-Foster method
-        p = len(censored)
-        q = len(censored.loc[censored["Scores"] > 0])
-        H = round(get_head_count_ratio(censored), 2)
-        A = round(get_average_deprivation_score(censored, 9), 2)
+        H = round(get_head_count_ratio(censored, q), 2)
+        A = round(get_average_deprivation_score(censored, 9, q), 2)
         Mo = round(get_adjusted_head_count_ratio(A, H), 2)
 
         # Append the calculated values to the list
@@ -287,13 +567,13 @@ def calculate_values(scores: pd.DataFrame, number_of_dimensions: int) -> List[Di
     return values
 
 def calculate_all_subgroup_data(
-    scores: pd.DataFrame, demographics_matrix: pd.DataFrame, number_of_dimensions: int
+    scores: Union[pd.DataFrame, pd.Series], demographics_matrix: pd.DataFrame, number_of_dimensions: int
 ) -> List[Dict[str, Dict[str, List[Union[str, float]]]]]:
     """
     Calculate subgroup data based on the Alkire-Foster method for multiple dimensions.
 
     Parameters:
-    - scores (pd.DataFrame): DataFrame containing the scores for each individual across multiple dimensions.
+    - scores (Union[pd.DataFrame, pd.Series]): Series or DataFrame containing the scores for each individual across multiple dimensions.
     - demographics_matrix (pd.DataFrame): DataFrame containing demographic information for each individual.
     - number_of_dimensions (int): The number of dimensions for which subgroup data is calculated.
 
@@ -309,17 +589,119 @@ def calculate_all_subgroup_data(
         censored = get_censored_vector(scores, k)
 
         # Calculate subgroup data based on demographic information
-        data = calculate_subgroup_data(demographics_matrix, censored)
+        poor_mask = censored.to_numpy() > 0
+        data = calculate_subgroup_data(demographics_matrix, censored, poor_mask)
 
         # Organize the subgroup data into a dictionary
         k_dict = dict()
         for row in data:
             labels = list(row[1].keys())
-            values = [row[1][label] for label in labels]
+            values = list(row[1].values())
             heading = row[0]
             k_dict[heading] = {"labels": labels, "data": values}
 
         # Append the organized subgroup data to the list
         sub_group_data.append(k_dict)
 
-    return sub_group_data
\ No newline at end of file
+    return sub_group_data
+
+
+@dataclass
+class AFResult:
+    """
+    Results of a single Alkire-Foster evaluation at one cutoff score.
+
+    Attributes:
+        deprivation_matrix (Optional[pd.DataFrame]): Deprivation matrix (g0), when requested.
+        weighted_deprivation_matrix (Optional[pd.DataFrame]): Weighted deprivation matrix, when requested.
+        scores (pd.Series): Deprivation scores.
+        censored (pd.Series): Censored deprivation scores.
+        poor_mask (np.ndarray): Boolean mask of individuals identified as poor.
+        number_of_poor (int): Number of individuals identified as poor.
+        headcount_ratio (float): The headcount ratio (H) as a percentage.
+        average_deprivation_score (float): The average deprivation score (A) as a percentage.
+        adjusted_headcount_ratio (float): The adjusted headcount ratio (Mo) as a percentage.
+        subgroup_data (Optional[list]): Subgroup data, when a demographics matrix was given.
+    """
+
+    deprivation_matrix: Optional[pd.DataFrame]
+    weighted_deprivation_matrix: Optional[pd.DataFrame]
+    scores: pd.Series
+    censored: pd.Series
+    poor_mask: np.ndarray
+    number_of_poor: int
+    headcount_ratio: float
+    average_deprivation_score: float
+    adjusted_headcount_ratio: float
+    subgroup_data: Optional[list] = None
+
+
+def analyze(
+    dimensions_matrix: pd.DataFrame,
+    cutoff_matrix: pd.DataFrame,
+    weights_matrix: pd.DataFrame,
+    cutoff_score: float,
+    demographics_matrix: Optional[pd.DataFrame] = None,
+    return_matrices: bool = False,
+) -> AFResult:
+    """
+    Run the Alkire-Foster method for one cutoff score, computing the poverty mask only once.
+
+    Args:
+        dimensions_matrix (pd.DataFrame): DataFrame containing dimensions data.
+        cutoff_matrix (pd.DataFrame): DataFrame containing cutoff values.
+        weights_matrix (pd.DataFrame): DataFrame containing weights.
+        cutoff_score (float): Cutoff score used to identify the poor.
+        demographics_matrix (Optional[pd.DataFrame]): DataFrame containing demographic information.
+        return_matrices (bool): Also build and return the full deprivation and weighted deprivation matrices.
+
+    Returns:
+        AFResult: The scores, poverty mask and poverty measures, plus the intermediate matrices when requested.
+    """
+    weights = weights_matrix["Weight"].to_numpy(dtype=np.float64)
+
+    if return_matrices:
+        deprivation_matrix = get_deprivation_matrix(dimensions_matrix, cutoff_matrix)
+        weighted_deprivation_matrix = calculate_weighted_deprivation_matrix(
+            deprivation_matrix, weights_matrix
+        )
+
+        # Score straight from g0 with one GEMV rather than summing the weighted matrix
+        scores = _scores(deprivation_matrix.to_numpy(), weights)
+    else:
+        # Stream the rows so the (N, K) matrices are never materialized
+        deprivation_matrix = None
+        weighted_deprivation_matrix = None
+        scores = _chunked_scores(
+            dimensions_matrix, cutoff_matrix["Cutoff"].to_numpy(), weights
+        )
+
+    scores = pd.Series(scores, index=dimensions_matrix.index, name="Scores")
+    censored = get_censored_vector(scores, cutoff_score)
+
+    # Compute the poverty mask once and share it with every downstream measure
+    poor_mask = censored.to_numpy() > 0
+    number_of_poor = int(poor_mask.sum())
+
+    H = get_head_count_ratio(censored, number_of_poor)
+    A = get_average_deprivation_score(
+        censored, len(dimensions_matrix.columns), number_of_poor
+    )
+    Mo = get_adjusted_head_count_ratio(A, H)
+
+    subgroup_data = None
+    if demographics_matrix is not None:
+        subgroup_data = calculate_subgroup_data(demographics_matrix, censored, poor_mask)
+
+    return AFResult(
+        deprivation_matrix=deprivation_matrix,
+        weighted_deprivation_matrix=weighted_deprivation_matrix,
+        scores=scores,
+        censored=censored,
+        poor_mask=poor_mask,
+        number_of_poor=number_of_poor,
+        headcount_ratio=H,
+        average_deprivation_score=A,
+        adjusted_headcount_ratio=Mo,
+        subgroup_data=subgroup_data,
+    )